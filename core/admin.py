@@ -1,3 +1,26 @@
 from django.contrib import admin
+from django.contrib.auth.admin import UserAdmin as BaseUserAdmin
+from .models import User, Donation
 
 # Register your models here.
+
+@admin.register(User)
+class UserAdmin(BaseUserAdmin):
+    fieldsets = BaseUserAdmin.fieldsets + (('Role', {'fields': ('role',)}),)
+    # email is required and unique (ignoring case), so ask for it on "Add user"
+    add_fieldsets = (
+        (None, {
+            'classes': ('wide',),
+            'fields': ('username', 'email', 'role', 'usable_password', 'password1', 'password2'),
+        }),
+    )
+    list_display = ('username', 'email', 'role', 'is_staff')
+    list_filter = BaseUserAdmin.list_filter + ('role',)
+
+
+@admin.register(Donation)
+class DonationAdmin(admin.ModelAdmin):
+    list_display = ('title', 'donor', 'category', 'status', 'created_at')
+    list_filter = ('status', 'category')
+    # The changelist only shows the donor (also used by __str__)
+    list_select_related = ('donor',)
@@ -2,28 +2,46 @@ from django import forms
 from django.contrib.auth.forms import UserCreationForm
 from .models import User, DonorProfile, ReceiverProfile
 
+# Tailwind classes shared by every input. Widgets copy their attrs, so one
+# dict can be passed to all of them.
+INPUT_ATTRS = {'class': 'w-full p-2 border border-gray-300 rounded-md'}
+
 class UserRegistrationForm(UserCreationForm):
     """
     A form for creating new users. Includes a role selection.
     We use UserCreationForm to get the password handling.
     """
     # We add the 'role' field here, which is on our custom User model
-    role = forms.ChoiceField(
+    # TypedChoiceField so cleaned_data['role'] is an int, like User.Role
+    role = forms.TypedChoiceField(
         choices=User.Role.choices,
+        coerce=int,
         widget=forms.Select(attrs={
-            'class': 'w-full p-2 border border-gray-300 rounded-md',
+            **INPUT_ATTRS,
             'id': 'id_role'  # Important for the JavaScript in register.html
         })
     )
 
+    # password1/password2 are declared by UserCreationForm, not model fields,
+    # so they are redeclared here to style them instead of going through Meta.widgets
+    password1 = forms.CharField(
+        label="Password",
+        strip=False,
+        widget=forms.PasswordInput(attrs={**INPUT_ATTRS, 'autocomplete': 'new-password'}),
+    )
+    password2 = forms.CharField(
+        label="Password confirmation",
+        strip=False,
+        widget=forms.PasswordInput(attrs={**INPUT_ATTRS, 'autocomplete': 'new-password'}),
+        help_text="Enter the same password as before, for verification.",
+    )
+
     class Meta(UserCreationForm.Meta):
         model = User
-        fields = ('username', 'email', 'role', 'password', 'password2') # Specify fields from User model
+        fields = ('username', 'email', 'role') # Specify fields from User model
         widgets = {
-            'username': forms.TextInput(attrs={'class': 'w-full p-2 border border-gray-300 rounded-md'}),
-            'email': forms.EmailInput(attrs={'class': 'w-full p-2 border border-gray-300 rounded-md'}),
-            'password': forms.PasswordInput(attrs={'class': 'w-full p-2 border border-gray-300 rounded-md'}),
-            'password2': forms.PasswordInput(attrs={'class': 'w-full p-2 border border-gray-300 rounded-md'}),
+            'username': forms.TextInput(attrs=INPUT_ATTRS),
+            'email': forms.EmailInput(attrs=INPUT_ATTRS),
         }
 
 
@@ -36,9 +54,9 @@ class DonorProfileForm(forms.ModelForm):
         # These fields are now in sync with models.py
         fields = ('first_name', 'last_name', 'phone_number')
         widgets = {
-            'first_name': forms.TextInput(attrs={'class': 'w-full p-2 border border-gray-300 rounded-md'}),
-            'last_name': forms.TextInput(attrs={'class': 'w-full p-2 border border-gray-300 rounded-md'}),
-            'phone_number': forms.TextInput(attrs={'class': 'w-full p-2 border border-gray-300 rounded-md'}),
+            'first_name': forms.TextInput(attrs=INPUT_ATTRS),
+            'last_name': forms.TextInput(attrs=INPUT_ATTRS),
+            'phone_number': forms.TextInput(attrs=INPUT_ATTRS),
         }
 
 
@@ -51,8 +69,8 @@ class ReceiverProfileForm(forms.ModelForm):
         # These fields are now in sync with models.py
         fields = ('ngo_name', 'registration_number', 'phone_number')
         widgets = {
-            'ngo_name': forms.TextInput(attrs={'class': 'w-full p-2 border border-gray-300 rounded-md'}),
-            'registration_number': forms.TextInput(attrs={'class': 'w-full p-2 border border-gray-300 rounded-md'}),
-            'phone_number': forms.TextInput(attrs={'class': 'w-full p-2 border border-gray-300 rounded-md'}),
+            'ngo_name': forms.TextInput(attrs=INPUT_ATTRS),
+            'registration_number': forms.TextInput(attrs=INPUT_ATTRS),
+            'phone_number': forms.TextInput(attrs=INPUT_ATTRS),
         }
 
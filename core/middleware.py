@@ -0,0 +1,19 @@
+from django.conf import settings
+from whitenoise.middleware import WhiteNoiseMiddleware
+
+
+class MediaWhiteNoiseMiddleware(WhiteNoiseMiddleware):
+    """
+    WhiteNoise, plus user uploads (MEDIA_ROOT) served under MEDIA_URL in
+    development.
+
+    Media is only added in autorefresh mode (the default when DEBUG is on),
+    where WhiteNoise looks files up on each request, so new uploads show up
+    straight away. Outside it WhiteNoise only knows the files that existed at
+    startup, so in production /media/ should be served by the web server
+    (e.g. an nginx `location /media/` with sendfile) instead.
+    """
+    def __init__(self, get_response=None, settings=settings):
+        super().__init__(get_response, settings=settings)
+        if self.autorefresh:
+            self.add_files(settings.MEDIA_ROOT, prefix=settings.MEDIA_URL)
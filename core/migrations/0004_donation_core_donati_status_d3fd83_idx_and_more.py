@@ -0,0 +1,33 @@
+# Generated by Django 5.2.18 on 2026-10-14 14:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0003_alter_user_managers'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='donation',
+            index=models.Index(fields=['status', '-created_at'], name='core_donati_status_d3fd83_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='donation',
+            index=models.Index(fields=['category', 'status'], name='core_donati_categor_55a94c_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='donationrequest',
+            index=models.Index(fields=['receiver', 'status'], name='core_donati_receive_74c375_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='receiverprofile',
+            index=models.Index(fields=['is_verified'], name='core_receiv_is_veri_aba37d_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='report',
+            index=models.Index(fields=['report_type', 'created_at'], name='core_report_report__45a47e_idx'),
+        ),
+    ]
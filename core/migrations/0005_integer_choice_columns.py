@@ -0,0 +1,60 @@
+# Generated by Django 5.2.18 on 2026-10-14 14:10
+
+from django.db import migrations, models
+
+
+# Old string values -> new IntegerChoices values, per (model, field).
+# 'REJECTJED' is the value the old DonationRequest.Status.REJECTED stored.
+CHOICE_MAPS = [
+    ('user', 'role', {'DONOR': 1, 'RECEIVER': 2, 'ADMIN': 3}),
+    ('donation', 'status', {'AVAILABLE': 1, 'RESERVED': 2, 'COLLECTED': 3, 'EXPIRED': 4}),
+    ('donationrequest', 'status', {'PENDING': 1, 'ACCEPTED': 2, 'REJECTJED': 3, 'COLLECTED': 4}),
+    ('report', 'report_type', {'SPAM': 1, 'INAPPROPRIATE': 2, 'SCAM': 3, 'OTHER': 4}),
+]
+
+
+def strings_to_ints(apps, schema_editor):
+    # Runs while the columns are still CharFields, so the ints are stored as
+    # their digit strings and then cast by the AlterField operations below.
+    for model_name, field, mapping in CHOICE_MAPS:
+        model = apps.get_model('core', model_name)
+        for old, new in mapping.items():
+            model.objects.filter(**{field: old}).update(**{field: str(new)})
+
+
+def ints_to_strings(apps, schema_editor):
+    for model_name, field, mapping in CHOICE_MAPS:
+        model = apps.get_model('core', model_name)
+        for old, new in mapping.items():
+            model.objects.filter(**{field: str(new)}).update(**{field: old})
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0004_donation_core_donati_status_d3fd83_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.RunPython(strings_to_ints, ints_to_strings),
+        migrations.AlterField(
+            model_name='donation',
+            name='status',
+            field=models.PositiveSmallIntegerField(choices=[(1, 'Available'), (2, 'Reserved'), (3, 'Collected'), (4, 'Expired')], default=1),
+        ),
+        migrations.AlterField(
+            model_name='donationrequest',
+            name='status',
+            field=models.PositiveSmallIntegerField(choices=[(1, 'Pending'), (2, 'Accepted'), (3, 'Rejected'), (4, 'Collected')], default=1),
+        ),
+        migrations.AlterField(
+            model_name='report',
+            name='report_type',
+            field=models.PositiveSmallIntegerField(blank=True, choices=[(1, 'Spam'), (2, 'Inappropriate'), (3, 'Scam'), (4, 'Other')], null=True),
+        ),
+        migrations.AlterField(
+            model_name='user',
+            name='role',
+            field=models.PositiveSmallIntegerField(choices=[(1, 'Donor'), (2, 'Receiver'), (3, 'Admin')], default=1),
+        ),
+    ]
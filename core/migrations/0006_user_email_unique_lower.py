@@ -0,0 +1,51 @@
+# Generated by Django 5.2.18 on 2026-10-14 14:14
+
+import django.db.models.functions.text
+from django.db import migrations, models
+from django.db.models import Count
+from django.db.models.functions import Lower
+
+
+def check_emails(apps, schema_editor):
+    # The new constraint can't be added over blank or duplicate emails, and
+    # there's no correct address to invent, so stop with a list to fix by hand.
+    User = apps.get_model('core', 'User')
+    problems = []
+    blank = list(User.objects.filter(email='').values_list('username', flat=True))
+    if blank:
+        problems.append(f"users without an email: {', '.join(blank)}")
+    duplicates = list(
+        User.objects.exclude(email='')
+        .values(email_lower=Lower('email'))
+        .annotate(count=Count('id'))
+        .filter(count__gt=1)
+        .values_list('email_lower', flat=True)
+    )
+    if duplicates:
+        problems.append(f"emails used by more than one user (ignoring case): {', '.join(duplicates)}")
+    if problems:
+        raise RuntimeError(
+            "Cannot make User.email required and unique. Fix these users, then re-run migrate: "
+            + "; ".join(problems)
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auth', '0012_alter_user_first_name_max_length'),
+        ('core', '0005_integer_choice_columns'),
+    ]
+
+    operations = [
+        migrations.RunPython(check_emails, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='user',
+            name='email',
+            field=models.EmailField(max_length=254, verbose_name='email address'),
+        ),
+        migrations.AddConstraint(
+            model_name='user',
+            constraint=models.UniqueConstraint(django.db.models.functions.text.Lower('email'), name='uniq_lower_email', violation_error_message='A user with that email already exists.'),
+        ),
+    ]
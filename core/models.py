@@ -1,21 +1,67 @@
 from django.db import models
-from django.contrib.auth.models import AbstractUser
+from django.contrib.auth.models import AbstractUser, UserManager as DjangoUserManager
+from django.db.models.functions import Lower
 from django.db.models.signals import post_save
 from django.dispatch import receiver
 
 # Create your models here.
 
+class UserQuerySet(models.QuerySet):
+    def with_profiles(self):
+        """
+        Fetch both profiles in the same query, so listing users and
+        touching user.donor_profile / user.receiver_profile is not N+1.
+        """
+        return self.select_related('donor_profile', 'receiver_profile')
+
+    def lean(self):
+        """
+        Load only the columns routine lookups need (not the password hash,
+        names, flags, dates...). Other fields are fetched on access, so
+        don't use this for objects that will be edited or authenticated.
+        The profile relations are listed so this combines with with_profiles().
+        """
+        return self.only('id', 'username', 'role', 'email', 'donor_profile', 'receiver_profile')
+
+    def by_email(self, email):
+        """
+        Case-insensitive email match. Filters on LOWER(email) so it can use
+        the uniq_lower_email index (email__iexact can't, on any backend).
+        """
+        return self.alias(email_lower=Lower('email')).filter(email_lower=Lower(models.Value(email)))
+
+class UserManager(DjangoUserManager.from_queryset(UserQuerySet)):
+    """
+    Django's UserManager (create_user, create_superuser) plus the
+    UserQuerySet helpers.
+    """
+    pass
+
 class User(AbstractUser):
     """
     Custom User model inheriting from AbstractUser.
     Adds a 'role' to differentiate between user types.
     """
-    class Role(models.TextChoices):
-        DONOR = "DONOR", "Donor"
-        RECEIVER = "RECEIVER", "Receiver"
-        ADMIN = "ADMIN", "Admin"
-
-    role = models.CharField(max_length=50, choices=Role.choices, default=Role.DONOR)
+    class Role(models.IntegerChoices):
+        DONOR = 1, "Donor"
+        RECEIVER = 2, "Receiver"
+        ADMIN = 3, "Admin"
+
+    role = models.PositiveSmallIntegerField(choices=Role.choices, default=Role.DONOR)
+    # Required (AbstractUser allows blank) so it can be unique, see Meta
+    email = models.EmailField('email address')
+
+    objects = UserManager()
+
+    class Meta(AbstractUser.Meta):
+        # One account per email address, ignoring case
+        constraints = [
+            models.UniqueConstraint(
+                Lower('email'),
+                name='uniq_lower_email',
+                violation_error_message='A user with that email already exists.',
+            ),
+        ]
 
     def __str__(self):
         return self.username
@@ -49,6 +95,10 @@ class ReceiverProfile(models.Model):
     
     is_verified = models.BooleanField(default=False, help_text="Verified by admin (FR1)")
 
+    class Meta:
+        # Admins filter receivers by verification status
+        indexes = [models.Index(fields=['is_verified'])]
+
     def __str__(self):
         return f"{self.ngo_name} (Receiver)"
 
@@ -56,38 +106,40 @@ class ReceiverProfile(models.Model):
 # This ensures that when a User is made, their profile is created instantly.
 
 @receiver(post_save, sender=User)
-def create_user_profile(sender, instance, created, **kwargs):
-    if created:
-        if instance.role == User.Role.DONOR:
-            DonorProfile.objects.create(user=instance)
-        elif instance.role == User.Role.RECEIVER:
-            ReceiverProfile.objects.create(user=instance)
+def create_user_profile(sender, instance, created, raw=False, **kwargs):
+    # Skip fixture loads (loaddata), which bring their own profile rows, and
+    # saves where the caller creates the profile itself (see the register view).
+    if raw or not created or getattr(instance, '_skip_profile_signal', False):
+        return
+    if instance.role == User.Role.DONOR:
+        DonorProfile.objects.create(user=instance)
+    elif instance.role == User.Role.RECEIVER:
+        ReceiverProfile.objects.create(user=instance)
 
-@receiver(post_save, sender=User)
-def save_user_profile(sender, instance, **kwargs):
-    try:
-        if instance.role == User.Role.DONOR:
-            instance.donor_profile.save()
-        elif instance.role == User.Role.RECEIVER:
-            instance.receiver_profile.save()
-    except (DonorProfile.DoesNotExist, ReceiverProfile.DoesNotExist):
-        # This can happen during initial creation if profile hasn't been made yet
-        # The create_user_profile signal will handle it.
-        pass
+# Profiles are saved explicitly where they are edited (see the register view),
+# so there is no companion handler re-saving them on every User.save().
 
 
 # --- Other Models (Donation, Review, etc.) ---
 
+class DonationQuerySet(models.QuerySet):
+    def with_related(self):
+        """
+        Load the donor in the same query and prefetch requests/reviews
+        (with their users), so donation listings don't query once per row.
+        """
+        return self.select_related('donor').prefetch_related('requests__receiver', 'reviews__reviewer')
+
 class Donation(models.Model):
     """
     Represents a donation post created by a Donor.
     (FR4, FR15, FR16)
     """
-    class Status(models.TextChoices):
-        AVAILABLE = "AVAILABLE", "Available"
-        RESERVED = "RESERVED", "Reserved"
-        COLLECTED = "COLLECTED", "Collected"
-        EXPIRED = "EXPIRED", "Expired"
+    class Status(models.IntegerChoices):
+        AVAILABLE = 1, "Available"
+        RESERVED = 2, "Reserved"
+        COLLECTED = 3, "Collected"
+        EXPIRED = 4, "Expired"
 
     donor = models.ForeignKey(User, on_delete=models.CASCADE, related_name='donations')
     title = models.CharField(max_length=255)
@@ -102,10 +154,20 @@ class Donation(models.Model):
     pickup_location = models.CharField(max_length=255)
     pickup_instructions = models.TextField(blank=True, null=True)
 
-    status = models.CharField(max_length=50, choices=Status.choices, default=Status.AVAILABLE)
+    status = models.PositiveSmallIntegerField(choices=Status.choices, default=Status.AVAILABLE)
     created_at = models.DateTimeField(auto_now_add=True)
     expiry_date = models.DateTimeField(blank=True, null=True, help_text="e.g., for perishable goods")
 
+    objects = DonationQuerySet.as_manager()
+
+    class Meta:
+        # Browse pages filter by status/category and sort newest first.
+        # 'donor' is a ForeignKey, so it is already indexed.
+        indexes = [
+            models.Index(fields=['status', '-created_at']),
+            models.Index(fields=['category', 'status']),
+        ]
+
     def __str__(self):
         return f"{self.title} (by {self.donor.username})"
 
@@ -114,20 +176,22 @@ class DonationRequest(models.Model):
     Links a Receiver to a Donation they have requested.
     (FR6)
     """
-    class Status(models.TextChoices):
-        PENDING = "PENDING", "Pending"
-        ACCEPTED = "ACCEPTED", "Accepted"
-        REJECTED = "REJECTJED", "Rejected"
-        COLLECTED = "COLLECTED", "Collected"
+    class Status(models.IntegerChoices):
+        PENDING = 1, "Pending"
+        ACCEPTED = 2, "Accepted"
+        REJECTED = 3, "Rejected"
+        COLLECTED = 4, "Collected"
 
     donation = models.ForeignKey(Donation, on_delete=models.CASCADE, related_name='requests')
     receiver = models.ForeignKey(User, on_delete=models.CASCADE, related_name='requests_made')
-    status = models.CharField(max_length=50, choices=Status.choices, default=Status.PENDING)
+    status = models.PositiveSmallIntegerField(choices=Status.choices, default=Status.PENDING)
     requested_at = models.DateTimeField(auto_now_add=True)
 
     class Meta:
         # A receiver can only request a specific donation once
         unique_together = ('donation', 'receiver')
+        # "My requests" lookups filter by receiver and status
+        indexes = [models.Index(fields=['receiver', 'status'])]
 
     def __str__(self):
         return f"Request for '{self.donation.title}' by '{self.receiver.username}'"
@@ -154,11 +218,11 @@ class Report(models.Model):
     A report filed by a user against a donation post or another user.
     (FR10)
     """
-    class ReportType(models.TextChoices):
-        SPAM = "SPAM", "Spam"
-        INAPPROPRIATE = "INAPPROPRIATE", "Inappropriate"
-        SCAM = "SCAM", "Scam"
-        OTHER = "OTHER", "Other"
+    class ReportType(models.IntegerChoices):
+        SPAM = 1, "Spam"
+        INAPPROPRIATE = 2, "Inappropriate"
+        SCAM = 3, "Scam"
+        OTHER = 4, "Other"
 
     # The user who filed the report
     reporter = models.ForeignKey(User, on_delete=models.SET_NULL, null=True, related_name='reports_filed')
@@ -170,10 +234,13 @@ class Report(models.Model):
     user_reported = models.ForeignKey(User, on_delete=models.SET_NULL, blank=True, null=True, related_name='reports_received')
 
     # --- FIX: Added null=True, blank=True to make field optional ---
-    report_type = models.CharField(max_length=50, choices=ReportType.choices, blank=True, null=True)
+    report_type = models.PositiveSmallIntegerField(choices=ReportType.choices, blank=True, null=True)
     description = models.TextField()
     created_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        indexes = [models.Index(fields=['report_type', 'created_at'])]
+
     def __str__(self):
-        return f"Report {self.report_type or 'N/A'} by {self.reporter.username if self.reporter else 'Unknown'}"
+        return f"Report {self.get_report_type_display() or 'N/A'} by {self.reporter.username if self.reporter else 'Unknown'}"
 
@@ -1,3 +1,219 @@
-from django.test import TestCase
+from django.db import connection
+from django.db.migrations.executor import MigrationExecutor
+from django.db.models.signals import post_save
+from django.test import TestCase, TransactionTestCase
+from django.urls import reverse
+
+from .models import User, DonorProfile, ReceiverProfile
 
 # Create your tests here.
+
+PASSWORD = 'S3cret-pass!'
+
+
+class RegisterViewTests(TestCase):
+    def post(self, **data):
+        payload = {
+            'username': 'alice',
+            'email': 'alice@example.com',
+            'role': str(User.Role.DONOR),
+            'password1': PASSWORD,
+            'password2': PASSWORD,
+        }
+        payload.update(data)
+        return self.client.post(reverse('register'), payload)
+
+    def test_donor_registration_creates_one_profile(self):
+        response = self.post(first_name='Alice', last_name='Smith')
+
+        self.assertRedirects(response, reverse('index'), fetch_redirect_response=False)
+        user = User.objects.get(username='alice')
+        self.assertEqual(user.role, User.Role.DONOR)
+        self.assertTrue(user.check_password(PASSWORD))
+        self.assertEqual(DonorProfile.objects.count(), 1)
+        self.assertEqual(user.donor_profile.first_name, 'Alice')
+        self.assertFalse(ReceiverProfile.objects.exists())
+
+    def test_receiver_registration_creates_one_profile(self):
+        response = self.post(role=str(User.Role.RECEIVER), ngo_name='Food Bank', registration_number='NGO-1')
+
+        self.assertRedirects(response, reverse('index'), fetch_redirect_response=False)
+        user = User.objects.get(username='alice')
+        self.assertEqual(user.role, User.Role.RECEIVER)
+        self.assertEqual(ReceiverProfile.objects.count(), 1)
+        self.assertEqual(user.receiver_profile.ngo_name, 'Food Bank')
+        self.assertFalse(DonorProfile.objects.exists())
+
+    def test_invalid_profile_leaves_no_user(self):
+        # ngo_name and registration_number are required for receivers
+        response = self.post(role=str(User.Role.RECEIVER))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(User.objects.exists())
+        self.assertFalse(ReceiverProfile.objects.exists())
+        self.assertIn('ngo_name', response.context['profile_form'].errors)
+
+    def test_duplicate_email_is_a_form_error(self):
+        User.objects.create_user('bob', 'Alice@Example.com', PASSWORD)
+
+        response = self.post(email='alice@EXAMPLE.com')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, 'A user with that email already exists.')
+        self.assertEqual(User.objects.count(), 1)
+
+
+class CreateUserProfileSignalTests(TestCase):
+    def test_creates_profile_for_new_user(self):
+        user = User.objects.create_user('alice', 'alice@example.com', PASSWORD)
+        self.assertTrue(DonorProfile.objects.filter(user=user).exists())
+
+    def test_skipped_when_flagged(self):
+        user = User(username='alice', email='alice@example.com')
+        user._skip_profile_signal = True
+        user.save()
+        self.assertFalse(DonorProfile.objects.exists())
+
+    def test_skipped_for_raw_saves(self):
+        user = User(username='alice', email='alice@example.com')
+        user._skip_profile_signal = True
+        user.save()
+        del user._skip_profile_signal
+
+        # What loaddata sends for a fixture User
+        post_save.send(sender=User, instance=user, created=True, raw=True)
+        self.assertFalse(DonorProfile.objects.exists())
+
+
+class IntegerChoiceMigrationTests(TransactionTestCase):
+    """
+    0005_integer_choice_columns maps the old string choices to ints and back.
+    """
+    before = [('core', '0004_donation_core_donati_status_d3fd83_idx_and_more')]
+    after = [('core', '0005_integer_choice_columns')]
+
+    def migrate(self, targets):
+        executor = MigrationExecutor(connection)
+        executor.loader.build_graph()
+        executor.migrate(targets)
+        return executor.loader.project_state(targets).apps
+
+    def tearDown(self):
+        executor = MigrationExecutor(connection)
+        executor.migrate(executor.loader.graph.leaf_nodes())
+
+    def test_strings_map_to_ints_and_back(self):
+        apps = self.migrate(self.before)
+        OldUser = apps.get_model('core', 'User')
+        OldDonation = apps.get_model('core', 'Donation')
+        OldRequest = apps.get_model('core', 'DonationRequest')
+        OldReport = apps.get_model('core', 'Report')
+
+        # post_save receivers are bound to the current User model, so
+        # historical saves don't trigger create_user_profile
+        donor = OldUser.objects.create(username='donor', email='donor@example.com', role='DONOR')
+        receiver = OldUser.objects.create(username='receiver', email='receiver@example.com', role='RECEIVER')
+        OldUser.objects.create(username='admin', email='admin@example.com', role='ADMIN')
+        donations = {
+            status: OldDonation.objects.create(donor=donor, title=status, description='', category='Food',
+                                               pickup_location='Here', status=status)
+            for status in ('AVAILABLE', 'RESERVED', 'COLLECTED', 'EXPIRED')
+        }
+        request_statuses = {'AVAILABLE': 'PENDING', 'RESERVED': 'ACCEPTED', 'COLLECTED': 'REJECTJED', 'EXPIRED': 'COLLECTED'}
+        for title, status in request_statuses.items():
+            OldRequest.objects.create(donation=donations[title], receiver=receiver, status=status)
+        for report_type in ('SPAM', 'INAPPROPRIATE', 'SCAM', 'OTHER', None):
+            OldReport.objects.create(reporter=donor, report_type=report_type, description='')
+
+        apps = self.migrate(self.after)
+        NewUser = apps.get_model('core', 'User')
+        NewDonation = apps.get_model('core', 'Donation')
+        NewRequest = apps.get_model('core', 'DonationRequest')
+        NewReport = apps.get_model('core', 'Report')
+
+        self.assertEqual(dict(NewUser.objects.values_list('username', 'role')),
+                         {'donor': 1, 'receiver': 2, 'admin': 3})
+        self.assertEqual(dict(NewDonation.objects.values_list('title', 'status')),
+                         {'AVAILABLE': 1, 'RESERVED': 2, 'COLLECTED': 3, 'EXPIRED': 4})
+        # 'COLLECTED' holds the request stored with the misspelt 'REJECTJED'
+        self.assertEqual(dict(NewRequest.objects.values_list('donation__title', 'status')),
+                         {'AVAILABLE': 1, 'RESERVED': 2, 'COLLECTED': 3, 'EXPIRED': 4})
+        self.assertCountEqual(NewReport.objects.values_list('report_type', flat=True), [1, 2, 3, 4, None])
+
+        apps = self.migrate(self.before)
+        OldUser = apps.get_model('core', 'User')
+        OldRequest = apps.get_model('core', 'DonationRequest')
+
+        self.assertEqual(dict(OldUser.objects.values_list('username', 'role')),
+                         {'donor': 'DONOR', 'receiver': 'RECEIVER', 'admin': 'ADMIN'})
+        self.assertCountEqual(OldRequest.objects.values_list('status', flat=True),
+                              ['PENDING', 'ACCEPTED', 'REJECTJED', 'COLLECTED'])
+
+
+class UserAdminAddTests(TestCase):
+    def setUp(self):
+        admin = User.objects.create_superuser('admin', 'admin@example.com', PASSWORD)
+        self.client.force_login(admin)
+
+    def add_user(self, **data):
+        payload = {
+            'username': 'alice',
+            'email': 'alice@example.com',
+            'role': str(User.Role.RECEIVER),
+            'usable_password': 'true',
+            'password1': PASSWORD,
+            'password2': PASSWORD,
+        }
+        payload.update(data)
+        return self.client.post(reverse('admin:core_user_add'), payload)
+
+    def test_add_user_saves_email_and_role(self):
+        response = self.add_user()
+
+        self.assertEqual(response.status_code, 302)
+        user = User.objects.get(username='alice')
+        self.assertEqual(user.email, 'alice@example.com')
+        self.assertEqual(user.role, User.Role.RECEIVER)
+
+    def test_duplicate_email_is_a_form_error(self):
+        self.add_user()
+        response = self.add_user(username='alice2', email='ALICE@example.com')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, 'A user with that email already exists.')
+        self.assertFalse(User.objects.filter(username='alice2').exists())
+
+
+class UniqueEmailMigrationTests(TransactionTestCase):
+    """
+    0006_user_email_unique_lower refuses to run over blank or duplicate emails.
+    """
+    before = [('core', '0005_integer_choice_columns')]
+    after = [('core', '0006_user_email_unique_lower')]
+
+    def migrate(self, targets):
+        executor = MigrationExecutor(connection)
+        executor.loader.build_graph()
+        executor.migrate(targets)
+        return executor.loader.project_state(targets).apps
+
+    def tearDown(self):
+        executor = MigrationExecutor(connection)
+        executor.migrate(executor.loader.graph.leaf_nodes())
+
+    def test_blank_and_duplicate_emails_stop_the_migration(self):
+        apps = self.migrate(self.before)
+        OldUser = apps.get_model('core', 'User')
+        OldUser.objects.create(username='nomail', email='')
+        OldUser.objects.create(username='alice', email='alice@example.com')
+        OldUser.objects.create(username='alice2', email='ALICE@example.com')
+
+        with self.assertRaisesMessage(RuntimeError, 'Cannot make User.email required and unique') as cm:
+            self.migrate(self.after)
+        self.assertIn('users without an email: nomail', str(cm.exception))
+        self.assertIn('alice@example.com', str(cm.exception))
+
+        # Once the rows are fixed the migration goes through
+        OldUser.objects.filter(username='nomail').update(email='nomail@example.com')
+        OldUser.objects.filter(username='alice2').update(email='alice2@example.com')
+        self.migrate(self.after)
@@ -1,9 +1,17 @@
 from django.urls import path
 from django.contrib.auth import views as auth_views
+from django.views.decorators.cache import cache_page
+from django.views.decorators.vary import vary_on_cookie
 from .views import index, register  # <-- THE FIX IS HERE
 
 urlpatterns = [
-    path('', index, name='index'),
+    # The homepage is static, so serve it from the cache. base.html shows the
+    # logged-in user and flash messages, so entries are keyed per Cookie header.
+    # vary_on_cookie is needed: cache_page stores the response before
+    # SessionMiddleware adds its own Vary: Cookie. Only visitors with no
+    # cookies share an entry; anyone with a session or csrftoken cookie
+    # (e.g. after opening /login/ or /register/) gets their own.
+    path('', cache_page(60 * 15)(vary_on_cookie(index)), name='index'),
     path('register/', register, name='register'), # <-- This now works
     
     # Login & Logout URLs (from Part C)
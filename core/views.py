@@ -1,5 +1,6 @@
 from django.shortcuts import render, redirect
 from django.contrib import messages
+from django.db import transaction
 from .forms import UserRegistrationForm, DonorProfileForm, ReceiverProfileForm
 from .models import User
 import logging
@@ -15,73 +16,85 @@ def index(request):
     # and returns it to the browser.
     return render(request, 'core/index.html')
 
+# The profile form that goes with each registrable role
+PROFILE_FORMS = {
+    User.Role.DONOR: DonorProfileForm,
+    User.Role.RECEIVER: ReceiverProfileForm,
+}
+
 def register(request):
     """
     Handles user registration for both Donors and Receivers.
     """
+    profile_form = None
+
     if request.method == 'POST':
-        # Initialize forms with POST data
+        # Initialize forms with POST data. Only the profile form for the
+        # submitted role is built; the other one is never used.
         user_form = UserRegistrationForm(request.POST)
-        donor_form = DonorProfileForm(request.POST)
-        receiver_form = ReceiverProfileForm(request.POST)
+        try:
+            posted_role = int(request.POST.get('role'))
+        except (TypeError, ValueError):
+            posted_role = None
+        profile_form_class = PROFILE_FORMS.get(posted_role)
+        if profile_form_class is not None:
+            profile_form = profile_form_class(request.POST)
 
         # Check the user form first
         if user_form.is_valid():
             role = user_form.cleaned_data.get('role')
-            user = user_form.save(commit=False)
-            user.set_password(user_form.cleaned_data['password'])
-            # The role is already set by the form, so we just save
-            user.save()
 
-            # Now, handle the profile based on the role
-            try:
-                if role == User.Role.DONOR and donor_form.is_valid():
-                    profile = donor_form.save(commit=False)
-                    profile.user = user
-                    profile.save()
-                    messages.success(request, 'Donor account created successfully!')
-                    return redirect('index')
-                
-                elif role == User.Role.RECEIVER and receiver_form.is_valid():
-                    profile = receiver_form.save(commit=False)
-                    profile.user = user
-                    profile.save()
-                    messages.success(request, 'Receiver account created successfully! It will be reviewed by an admin.')
-                    return redirect('index')
-                
-                # Handle invalid profile forms
+            # Validate the profile form *before* anything is written,
+            # so an invalid profile never touches the DB.
+            if profile_form is not None and profile_form.is_valid():
+                try:
+                    # Save the user and profile together. If anything fails
+                    # the whole write is rolled back, so no orphan user is left.
+                    with transaction.atomic():
+                        # UserCreationForm hashes password1 for us here
+                        user = user_form.save(commit=False)
+                        # The role is already set by the form. We create the
+                        # profile below, so tell the post_save signal not to.
+                        user._skip_profile_signal = True
+                        user.save()
+
+                        profile = profile_form.save(commit=False)
+                        profile.user = user
+                        # The profile row can't exist yet: a single INSERT
+                        profile.save(force_insert=True)
+                except Exception as e:
+                    logger.error(f"Error creating profile for user {user_form.cleaned_data.get('username')}: {e}")
+                    messages.error(request, 'An unexpected error occurred while creating your profile. Please try again.')
                 else:
-                    # If the profile form (donor or receiver) is invalid,
-                    # we must delete the user we just created to avoid an orphan user.
-                    logger.warning(f"Registration failed for user {user_form.cleaned_data.get('username')} due to invalid profile form.")
-                    user.delete() # Rollback user creation
-                    # Manually add profile errors to be displayed
                     if role == User.Role.DONOR:
-                        messages.error(request, f"Please correct the errors in the Donor Profile: {donor_form.errors.as_text()}")
-                    elif role == User.Role.RECEIVER:
-                         messages.error(request, f"Please correct the errors in the Receiver Profile: {receiver_form.errors.as_text()}")
+                        messages.success(request, 'Donor account created successfully!')
                     else:
-                        messages.error(request, 'There was an error with your profile information. Please check the fields.')
+                        messages.success(request, 'Receiver account created successfully! It will be reviewed by an admin.')
+                    return redirect('index')
 
+            # Handle invalid profile forms. Their errors are rendered by the
+            # template from the bound form, so nothing is copied into messages.
+            else:
+                logger.warning(f"Registration failed for user {user_form.cleaned_data.get('username')} due to invalid profile form.")
+                if profile_form is None:
+                    # No profile form (and so no field errors) for this role
+                    messages.error(request, 'There was an error with your profile information. Please check the fields.')
 
-            except Exception as e:
-                # Log the error and delete the partial user to avoid orphans
-                logger.error(f"Error creating profile for user {user.username}: {e}")
-                user.delete() # Rollback user creation on profile error
-                messages.error(request, 'An unexpected error occurred while creating your profile. Please try again.')
-        
         # If user_form is invalid, fall through to render forms with errors
-        else:
-             messages.error(request, f"Please correct the errors in the Account Details: {user_form.errors.as_text()}")
 
     else:
         # GET request
         user_form = UserRegistrationForm()
-        donor_form = DonorProfileForm()
-        receiver_form = ReceiverProfileForm()
+
+    # The page shows both profile sections (toggled by role in JavaScript),
+    # so fill in whichever one we don't already have with an empty form.
+    # This only happens when rendering, never on a successful registration.
+    donor_form = profile_form if isinstance(profile_form, DonorProfileForm) else DonorProfileForm()
+    receiver_form = profile_form if isinstance(profile_form, ReceiverProfileForm) else ReceiverProfileForm()
 
     context = {
         'user_form': user_form,
+        'profile_form': profile_form,
         'donor_form': donor_form,
         'receiver_form': receiver_form
     }
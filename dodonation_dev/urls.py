@@ -17,9 +17,6 @@ Including another URLconf
 from django.contrib import admin
 # --- 'include' has been added here ---
 from django.urls import path, include
-# --- Add these two imports ---
-from django.conf import settings
-from django.conf.urls.static import static
 
 urlpatterns = [
     path('admin/', admin.site.urls),
@@ -27,10 +24,5 @@ urlpatterns = [
     path('', include('core.urls')),
 ]
 
-# --- Add this line at the bottom ---
-# This serves media files in development mode
-if settings.DEBUG:
-    urlpatterns += static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
-
-
-
+# Media files are served by core.middleware.MediaWhiteNoiseMiddleware in
+# development (see settings.MIDDLEWARE), not by a Django view.